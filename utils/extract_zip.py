@@ -1,7 +1,237 @@
 import zipfile
 import os
+import re
 import sys
+import queue
+import shutil
+import threading
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# Backend DEFLATE yang lebih cepat untuk dekompresi, urutan fallback:
+# 1. isal.isal_zlib   (Intel ISA-L, inflate SIMD)
+# 2. zlib_ng.zlib_ng  (zlib-ng)
+# 3. zlib stdlib      (tanpa patch)
+try:
+    from isal import isal_zlib as _deflate_backend
+except ImportError:
+    try:
+        from zlib_ng import zlib_ng as _deflate_backend
+    except ImportError:
+        _deflate_backend = None
+
+if _deflate_backend is not None:
+    _stdlib_get_decompressor = zipfile._get_decompressor
+
+    def _fast_get_decompressor(compress_type):
+        # Hanya jalur dekompresi yang diganti, kompresi tetap memakai zlib stdlib
+        if compress_type == zipfile.ZIP_DEFLATED:
+            return _deflate_backend.decompressobj(-15)
+        return _stdlib_get_decompressor(compress_type)
+
+    # ZipExtFile memanggil _get_decompressor saat membuka entry, sehingga semua
+    # fungsi extract_* di modul ini otomatis memakai backend yang lebih cepat
+    zipfile._get_decompressor = _fast_get_decompressor
+
+# Entry yang lebih besar dari ini dikerjakan sebagai task tersendiri
+# agar tidak menjadi straggler di salah satu worker
+LARGE_FILE_THRESHOLD = 16 * 1024 * 1024
+
+# Process pool baru dipakai jika total data terkompresi minimal sebesar ini;
+# di bawahnya biaya start worker (terutama spawn di Windows) lebih mahal
+# daripada dekompresinya, jadi dipakai jalur pipeline di satu proses
+PARALLEL_MIN_COMPRESSED_SIZE = 64 * 1024 * 1024
+
+# Kedalaman antrean pipeline dekompresi -> tulis, membatasi memori puncak
+# ke sekitar PIPELINE_QUEUE_SIZE x ukuran rata-rata entry
+PIPELINE_QUEUE_SIZE = 32
+PIPELINE_WRITERS = 2
+
+def _member_path(extract_to, file_name):
+    """
+    Hitung path tujuan sebuah entry ZIP dengan sanitasi yang sama seperti ZipFile.extract
+    
+    Args:
+        extract_to (str): Folder tujuan ekstraksi
+        file_name (str): Nama entry di dalam ZIP
+    """
+    arcname = file_name.replace('/', os.path.sep)
+    if os.path.altsep:
+        arcname = arcname.replace(os.path.altsep, os.path.sep)
+    # Buang drive letter, komponen kosong, '.' dan '..' (mencegah zip slip)
+    arcname = os.path.splitdrive(arcname)[1]
+    invalid_path_parts = ('', os.path.curdir, os.path.pardir)
+    arcname = os.path.sep.join(x for x in arcname.split(os.path.sep) if x not in invalid_path_parts)
+    if os.path.sep == '\\':
+        arcname = zipfile.ZipFile._sanitize_windows_name(arcname, os.path.sep)
+    return os.path.normpath(os.path.join(extract_to, arcname))
+
+def _prepare_directories(infos, extract_to):
+    """
+    Buat seluruh struktur folder sekali di proses utama (satu os.makedirs per
+    folder unik), sehingga worker hanya menulis file dan tidak berebut os.makedirs
+    
+    Args:
+        infos (list): List ZipInfo dari zip_ref.infolist()
+        extract_to (str): Folder tujuan ekstraksi
+    """
+    directories = set()
+    for info in infos:
+        target = _member_path(extract_to, info.filename)
+        directories.add(target if info.is_dir() else os.path.dirname(target))
+    
+    for directory in directories:
+        os.makedirs(directory, exist_ok=True)
+
+def _write_member(zip_ref, info, target):
+    """
+    Tulis satu entry ZIP langsung ke target tanpa cek/buat folder per entry
+    (ZipFile.extract melakukan os.path.exists + os.makedirs untuk setiap file)
+    
+    Args:
+        zip_ref (zipfile.ZipFile): Handle ZIP yang sudah dibuka
+        info (zipfile.ZipInfo): Entry yang diekstrak
+        target (str): Path tujuan hasil _member_path (folder sudah dibuat)
+    """
+    with zip_ref.open(info) as src, open(target, 'wb') as dst:
+        shutil.copyfileobj(src, dst)
+
+def _partition_members(file_infos, n_chunks):
+    """
+    Bagi entry ZIP menjadi task untuk process pool
+    
+    Args:
+        file_infos (list): List ZipInfo (tanpa entry folder)
+        n_chunks (int): Jumlah chunk untuk file berukuran kecil
+    """
+    # File besar masing-masing mendapat task sendiri
+    tasks = [[info.filename] for info in file_infos if info.file_size > LARGE_FILE_THRESHOLD]
+    
+    # Sisanya dibagi round-robin ke n_chunks task
+    small_files = [info.filename for info in file_infos if info.file_size <= LARGE_FILE_THRESHOLD]
+    tasks.extend(chunk for chunk in (small_files[i::n_chunks] for i in range(n_chunks)) if chunk)
+    return tasks
+
+def _extract_members(zip_path, member_names, extract_to, password=None):
+    """
+    Worker process: buka handle ZipFile sendiri lalu ekstrak entry yang ditugaskan
+    
+    Args:
+        zip_path (str): Path ke file ZIP
+        member_names (list): Nama entry yang diekstrak worker ini
+        extract_to (str): Folder tujuan ekstraksi
+        password (str): Password jika ZIP terproteksi
+    """
+    failures = []
+    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+        if password:
+            zip_ref.setpassword(password.encode())
+        
+        for file_name in member_names:
+            try:
+                _write_member(zip_ref, zip_ref.getinfo(file_name), _member_path(extract_to, file_name))
+            except Exception as e:
+                failures.append((file_name, str(e)))
+    
+    return member_names, failures
+
+def _write_worker(work_queue, failures):
+    """
+    Thread penulis: ambil (path, data) dari antrean lalu tulis ke disk
+    
+    Args:
+        work_queue (queue.Queue): Antrean berisi (target, file_name, data), None sebagai sentinel
+        failures (list): List untuk mencatat (file_name, error)
+    """
+    while True:
+        item = work_queue.get()
+        if item is None:
+            break
+        
+        target, file_name, data = item
+        try:
+            with open(target, 'wb') as f:
+                f.write(data)
+        except Exception as e:
+            failures.append((file_name, str(e)))
+
+def _extract_pipelined(zip_ref, infos, extract_to, show_progress):
+    """
+    Ekstrak entry ZIP dengan pipeline: thread ini mendekompresi, thread lain menulis ke disk
+    
+    Args:
+        zip_ref (zipfile.ZipFile): Handle ZIP yang sudah dibuka
+        infos (list): List ZipInfo dari zip_ref.infolist()
+        extract_to (str): Folder tujuan ekstraksi (struktur folder sudah dibuat)
+        show_progress (bool): Tampilkan progress ekstraksi
+    """
+    work_queue = queue.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+    failures = []
+    writers = [threading.Thread(target=_write_worker, args=(work_queue, failures), daemon=True)
+               for _ in range(PIPELINE_WRITERS)]
+    for writer in writers:
+        writer.start()
+    
+    total_files = len(infos)
+    progress_step = max(1, total_files // 100)
+    
+    try:
+        for i, info in enumerate(infos, 1):
+            if not info.is_dir():
+                target = _member_path(extract_to, info.filename)
+                try:
+                    if info.file_size > LARGE_FILE_THRESHOLD:
+                        # File besar di-stream langsung agar tidak ditampung utuh di memori
+                        _write_member(zip_ref, info, target)
+                    else:
+                        # GIL dilepas saat inflate dan write, sehingga keduanya benar-benar overlap
+                        work_queue.put((target, info.filename, zip_ref.read(info)))
+                except Exception as e:
+                    failures.append((info.filename, str(e)))
+            
+            if show_progress and (i % progress_step == 0 or i == total_files):
+                file_name = info.filename
+                progress = (i / total_files) * 100
+                print(f"\r⏳ Progress: {progress:.1f}% ({i}/{total_files}) - {file_name[:50]}{'...' if len(file_name) > 50 else ''}", end='')
+    finally:
+        for _ in writers:
+            work_queue.put(None)
+        for writer in writers:
+            writer.join()
+    
+    for file_name, error in failures:
+        print(f"\n⚠️  Gagal mengekstrak {file_name}: {error}")
+
+def _extract_parallel(zip_path, file_infos, extract_to, password, max_workers, show_progress):
+    """
+    Ekstrak entry ZIP secara paralel dengan ProcessPoolExecutor
+    
+    Args:
+        zip_path (str): Path ke file ZIP
+        file_infos (list): List ZipInfo (tanpa entry folder)
+        extract_to (str): Folder tujuan ekstraksi
+        password (str): Password jika ZIP terproteksi
+        max_workers (int): Jumlah worker process
+        show_progress (bool): Tampilkan progress ekstraksi
+    """
+    tasks = _partition_members(file_infos, max_workers)
+    total_files = len(file_infos)
+    done_files = 0
+    
+    with ProcessPoolExecutor(max_workers=min(max_workers, len(tasks))) as executor:
+        futures = [executor.submit(_extract_members, zip_path, names, extract_to, password)
+                   for names in tasks]
+        
+        for future in as_completed(futures):
+            names, failures = future.result()
+            done_files += len(names)
+            
+            for file_name, error in failures:
+                print(f"\n⚠️  Gagal mengekstrak {file_name}: {error}")
+            
+            if show_progress:
+                progress = (done_files / total_files) * 100
+                print(f"\r⏳ Progress: {progress:.1f}% ({done_files}/{total_files})", end='')
 
 def extract_zip_basic(zip_path, extract_to=None):
     """
@@ -31,7 +261,7 @@ def extract_zip_basic(zip_path, extract_to=None):
     except Exception as e:
         print(f"❌ Error: {str(e)}")
 
-def extract_zip_advanced(zip_path, extract_to=None, password=None, show_progress=True):
+def extract_zip_advanced(zip_path, extract_to=None, password=None, show_progress=True, max_workers=None):
     """
     Ekstraksi ZIP dengan fitur advanced
     
@@ -40,6 +270,7 @@ def extract_zip_advanced(zip_path, extract_to=None, password=None, show_progress
         extract_to (str): Folder tujuan ekstraksi
         password (str): Password jika ZIP terproteksi
         show_progress (bool): Tampilkan progress ekstraksi
+        max_workers (int): Jumlah worker process untuk ZIP besar (default: os.cpu_count(), 1 = serial)
     """
     try:
         # Setup folder tujuan
@@ -55,23 +286,26 @@ def extract_zip_advanced(zip_path, extract_to=None, password=None, show_progress
                 zip_ref.setpassword(password.encode())
             
             # Dapatkan list file dalam ZIP
-            file_list = zip_ref.namelist()
-            total_files = len(file_list)
+            infos = zip_ref.infolist()
+            total_files = len(infos)
             
             print(f"📦 Mengekstrak {total_files} file dari {zip_path}")
             print(f"📁 Tujuan: {extract_to}")
             
-            # Ekstrak file satu per satu dengan progress
-            for i, file_name in enumerate(file_list, 1):
-                try:
-                    zip_ref.extract(file_name, extract_to)
-                    
-                    if show_progress:
-                        progress = (i / total_files) * 100
-                        print(f"\r⏳ Progress: {progress:.1f}% ({i}/{total_files}) - {file_name[:50]}{'...' if len(file_name) > 50 else ''}", end='')
-                        
-                except Exception as e:
-                    print(f"\n⚠️  Gagal mengekstrak {file_name}: {str(e)}")
+            # Buat struktur folder sekali sebelum ekstraksi
+            _prepare_directories(infos, extract_to)
+            
+            file_infos = [info for info in infos if not info.is_dir()]
+            workers = max_workers or os.cpu_count() or 1
+            
+            compressed_size = sum(info.compress_size for info in file_infos)
+            
+            if workers > 1 and len(file_infos) > 1 and compressed_size >= PARALLEL_MIN_COMPRESSED_SIZE:
+                # Dekompresi DEFLATE dibagi ke beberapa core
+                _extract_parallel(zip_path, file_infos, extract_to, password, workers, show_progress)
+            else:
+                # Dekompresi dan penulisan ke disk berjalan overlap
+                _extract_pipelined(zip_ref, infos, extract_to, show_progress)
             
             if show_progress:
                 print("\n✅ Ekstraksi selesai!")
@@ -146,29 +380,37 @@ def extract_specific_files(zip_path, file_patterns, extract_to=None):
         os.makedirs(extract_to, exist_ok=True)
         
         with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-            all_files = zip_ref.namelist()
             extracted_count = 0
             
-            for pattern in file_patterns:
-                matching_files = [f for f in all_files if pattern.lower() in f.lower()]
-                
-                for file_name in matching_files:
-                    zip_ref.extract(file_name, extract_to)
-                    print(f"✅ Diekstrak: {file_name}")
-                    extracted_count += 1
+            # Gabungkan semua pattern jadi satu regex agar tiap nama file cukup dicek sekali
+            patterns = [re.escape(p.lower()) for p in file_patterns]
+            matcher = re.compile('|'.join(patterns)) if patterns else None
+            
+            matching_infos = [info for info in zip_ref.infolist()
+                              if matcher is not None and matcher.search(info.filename.lower())]
+            
+            # Buat folder sekali untuk semua file yang cocok, lalu tulis langsung
+            _prepare_directories(matching_infos, extract_to)
+            
+            for info in matching_infos:
+                if not info.is_dir():
+                    _write_member(zip_ref, info, _member_path(extract_to, info.filename))
+                print(f"✅ Diekstrak: {info.filename}")
+                extracted_count += 1
             
             print(f"📊 Total file diekstrak: {extracted_count}")
             
     except Exception as e:
         print(f"❌ Error: {str(e)}")
 
-def batch_extract_zips(zip_folder, extract_base_folder=None):
+def batch_extract_zips(zip_folder, extract_base_folder=None, max_workers=None):
     """
     Ekstrak semua file ZIP dalam folder
     
     Args:
         zip_folder (str): Folder yang berisi file-file ZIP
         extract_base_folder (str): Folder dasar untuk ekstraksi
+        max_workers (int): Jumlah ZIP yang diekstrak paralel (default: setengah jumlah core)
     """
     try:
         if extract_base_folder is None:
@@ -176,20 +418,33 @@ def batch_extract_zips(zip_folder, extract_base_folder=None):
             
         os.makedirs(extract_base_folder, exist_ok=True)
         
-        zip_files = [f for f in os.listdir(zip_folder) if f.lower().endswith('.zip')]
+        # scandir: DirEntry sudah membawa path lengkap dan info stat
+        with os.scandir(zip_folder) as it:
+            zip_entries = [e for e in it if e.is_file() and e.name.lower().endswith('.zip')]
         
-        if not zip_files:
+        if not zip_entries:
             print(f"❌ Tidak ada file ZIP ditemukan di {zip_folder}")
             return
             
-        print(f"📦 Ditemukan {len(zip_files)} file ZIP")
+        print(f"📦 Ditemukan {len(zip_entries)} file ZIP")
+        
+        # DEFLATE berat di CPU, default setengah core agar memori tetap aman
+        if max_workers is None:
+            max_workers = max(1, (os.cpu_count() or 1) // 2)
         
-        for i, zip_file in enumerate(zip_files, 1):
-            zip_path = os.path.join(zip_folder, zip_file)
-            extract_folder = os.path.join(extract_base_folder, Path(zip_file).stem)
+        # Tiap ZIP independen, jadi satu ZIP = satu worker process.
+        # Ekstraksi di dalam worker dibuat serial agar tidak membuat process pool bersarang
+        with ProcessPoolExecutor(max_workers=min(max_workers, len(zip_entries))) as executor:
+            futures = {}
+            for entry in zip_entries:
+                extract_folder = os.path.join(extract_base_folder, entry.name.rpartition('.')[0])
+                future = executor.submit(extract_zip_advanced, entry.path, extract_folder,
+                                         None, False, 1)
+                futures[future] = entry.name
             
-            print(f"\n[{i}/{len(zip_files)}] Mengekstrak: {zip_file}")
-            extract_zip_advanced(zip_path, extract_folder, show_progress=False)
+            for i, future in enumerate(as_completed(futures), 1):
+                future.result()
+                print(f"\n[{i}/{len(zip_entries)}] Selesai: {futures[future]}")
             
         print(f"\n✅ Semua file ZIP berhasil diekstrak ke {extract_base_folder}")
         
@@ -3,14 +3,140 @@ import pandas as pd
 import os
 import numpy as np
 from datetime import datetime
-import glob
+import re
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor
-import multiprocessing as mp
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from collections import defaultdict
 
+# Queried once at import; used for worker defaults and the capability report
+_CPU_COUNT = os.cpu_count() or 1
+
+# Video filenames look like "user<id>-<YYYY-MM-DD> <HH>-<MM>-<SS>.mp4"
+_VIDEO_NAME_PATTERN = re.compile(r'user(\d+)-(\d{4}-\d{2}-\d{2})(?: (\d{2})-)?')
+_VIDEO_EXTENSIONS = ('.mp4', '.mkv')
+# Start time part of a video filename, equivalent to '%Y-%m-%d %H-%M-%S'
+_VIDEO_START_PATTERN = re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2}) (\d{1,2})-(\d{1,2})-(\d{1,2})')
+
+class _SequentialFrameReader:
+    """Read frames in ascending order by decoding forward instead of seeking per frame"""
+    
+    def __init__(self, cap, seek_threshold):
+        """
+        Args:
+            cap (cv2.VideoCapture): Opened video capture
+            seek_threshold (int): Jump with a keyframe seek only when the target is
+                more than this many frames ahead of the decoder position
+        """
+        self.cap = cap
+        self.seek_threshold = seek_threshold
+        self.next_frame = 0
+        self.last_frame_number = None
+        self.last_frame = None
+    
+    def read(self, frame_number):
+        """Return (ret, frame) for frame_number, reusing the last frame if it repeats"""
+        if frame_number == self.last_frame_number:
+            return True, self.last_frame
+        
+        # Seeking makes FFmpeg decode forward from the previous keyframe, so it only
+        # pays off for backward or distant jumps
+        if frame_number < self.next_frame or frame_number - self.next_frame > self.seek_threshold:
+            if self.cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number):
+                self.next_frame = frame_number
+            elif frame_number < self.next_frame:
+                return False, None
+        
+        # grab() decodes without the color conversion and buffer copy of read()
+        while self.next_frame < frame_number:
+            if not self.cap.grab():
+                return False, None
+            self.next_frame += 1
+        
+        ret, frame = self.cap.read()
+        self.next_frame += 1
+        if ret:
+            self.last_frame_number = frame_number
+            self.last_frame = frame
+        return ret, frame
+
+class _NvdecCapture:
+    """Minimal VideoCapture-style wrapper around cv2.cudacodec.VideoReader (NVDEC decode)"""
+    
+    def __init__(self, video_path):
+        # Raises cv2.error when OpenCV was built without NVCUVID support
+        self.reader = cv2.cudacodec.createVideoReader(video_path)
+    
+    def isOpened(self):
+        return self.reader is not None
+    
+    def get(self, prop_id):
+        if prop_id == cv2.CAP_PROP_FPS:
+            return getattr(self.reader.format(), 'fps', 0)
+        return 0
+    
+    def set(self, prop_id, value):
+        # NVDEC streams cannot seek; frames are decoded forward only
+        return False
+    
+    def grab(self):
+        return self.reader.grab()
+    
+    def read(self):
+        ret, gpu_frame = self.reader.nextFrame()
+        if not ret:
+            return False, None
+        
+        # NVDEC outputs BGRA; convert on the GPU and download only the frame we keep
+        if gpu_frame.channels() == 4:
+            gpu_frame = cv2.cuda.cvtColor(gpu_frame, cv2.COLOR_BGRA2BGR)
+        return True, gpu_frame.download()
+    
+    def release(self):
+        self.reader = None
+
+def _write_file(output_path, data):
+    """Write encoded bytes with raw os-level calls, returning (success, message)"""
+    try:
+        fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+        try:
+            view = memoryview(data).cast('B')
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+    except OSError as e:
+        return (False, f"Could not save frame to {output_path}: {e}")
+    
+    print(f"✓ Extracted: {os.path.basename(output_path)}")
+    return (True, output_path)
+
+class _FrameWriter:
+    """Write encoded JPEGs on a background thread so disk I/O overlaps decoding"""
+    
+    def __init__(self):
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._pending = []
+        self._results = []
+    
+    def submit(self, output_path, data):
+        """Queue encoded bytes for writing"""
+        self._pending.append(self._executor.submit(_write_file, output_path, data))
+    
+    def add_result(self, result):
+        """Record a result that did not need a write (e.g. an encode failure)"""
+        self._results.append(result)
+    
+    def close(self):
+        """Wait for queued writes and return all (success, message) results"""
+        results = self._results + [future.result() for future in self._pending]
+        self._executor.shutdown()
+        self._pending = []
+        self._results = []
+        return results
+
 class GPUVideoFrameExtractor:
-    def __init__(self, excel_file_path, video_folder_path, output_folder_path, use_gpu=True, max_workers=None):
+    def __init__(self, excel_file_path, video_folder_path, output_folder_path, use_gpu=True, max_workers=None,
+                 jpeg_quality=85):
         """
         Initialize GPU-accelerated VideoFrameExtractor
         
@@ -20,12 +146,20 @@ class GPUVideoFrameExtractor:
             output_folder_path (str): Path to folder where extracted frames will be saved
             use_gpu (bool): Whether to use GPU acceleration
             max_workers (int): Number of parallel workers
+            jpeg_quality (int): JPEG quality of the extracted frames (0-100)
         """
         self.excel_file_path = excel_file_path
         self.video_folder_path = video_folder_path
         self.output_folder_path = output_folder_path
         self.use_gpu = use_gpu
-        self.max_workers = max_workers or mp.cpu_count()
+        self.max_workers = max_workers or _CPU_COUNT
+        self.jpeg_quality = jpeg_quality
+        # Baseline JPEG without the extra Huffman optimization pass
+        self.jpeg_params = [
+            cv2.IMWRITE_JPEG_QUALITY, jpeg_quality,
+            cv2.IMWRITE_JPEG_OPTIMIZE, 0,
+            cv2.IMWRITE_JPEG_PROGRESSIVE, 0
+        ]
         
         # Create output folder if it doesn't exist
         Path(self.output_folder_path).mkdir(parents=True, exist_ok=True)
@@ -36,6 +170,18 @@ class GPUVideoFrameExtractor:
             '/tantangan/status-http': 'challenge2'
         }
         
+        # Filename templates specialized per page, so naming a frame is a single format call.
+        # Bound str.format methods are used instead of lambdas because they stay picklable
+        # for the process pool
+        self._filename_fmt = {
+            page: f"user{{}}_{challenge}_time{{:02d}}{{:02d}}{{:02d}}.jpg".format
+            for page, challenge in self.page_mapping.items()
+        }
+        self._default_filename_fmt = "user{}_challenge_unknown_time{:02d}{:02d}{:02d}.jpg".format
+        
+        # Index video files once instead of globbing the folder per record
+        self._video_index, self._video_index_by_date = self.build_video_index()
+        
         # Check GPU availability
         self.gpu_available = self.check_gpu_support()
         if use_gpu and not self.gpu_available:
@@ -69,55 +215,79 @@ class GPUVideoFrameExtractor:
             return None
     
     def group_records_by_video(self, df):
-        """Group records by video file to minimize video loading"""
+        """Group record positions by video file to minimize video loading"""
         video_groups = defaultdict(list)
         
-        for index, row in df.iterrows():
-            user_id = row['user_id']
-            timestamp = row['timestamp']
-            
-            video_path = self.find_video_file(user_id, timestamp)
+        # Format whole columns at once instead of boxing every row with iterrows()
+        users = df['user_id'].astype(str).to_numpy()
+        dates = df['timestamp'].dt.strftime('%Y-%m-%d').to_numpy()
+        hours = df['timestamp'].dt.strftime('%H').to_numpy()
+        
+        for position, (user_id, date_str, hour_str) in enumerate(zip(users, dates, hours)):
+            video_path = self.lookup_video(user_id, date_str, hour_str)
             if video_path:
-                video_groups[video_path].append({
-                    'index': index,
-                    'user_id': user_id,
-                    'timestamp': timestamp,
-                    'page': row['page']
-                })
+                video_groups[video_path].append(position)
         
         return dict(video_groups)
     
-    def find_video_file(self, user_id, timestamp):
-        """Find the corresponding video file for a user and timestamp"""
-        date_str = timestamp.strftime('%Y-%m-%d')
-        hour_str = timestamp.strftime('%H')
-        
-        patterns = [
-            f"user{user_id}-{date_str} {hour_str}-*.mp4",
-            f"user{user_id}-{date_str} {hour_str}-*.mkv"
+    def build_records(self, df, positions):
+        """Resolve grouped row positions into record dicts for one video"""
+        rows = df.iloc[positions]
+        return [
+            {'index': index, 'user_id': user_id, 'timestamp': timestamp, 'page': page}
+            for index, user_id, timestamp, page in zip(
+                rows.index, rows['user_id'], rows['timestamp'], rows['page']
+            )
         ]
+    
+    def build_video_index(self):
+        """Scan the video folder once and index files by (user_id, date, hour) and (user_id, date)"""
+        by_hour = defaultdict(list)
+        by_date = defaultdict(list)
         
-        for pattern in patterns:
-            search_path = os.path.join(self.video_folder_path, pattern)
-            matches = glob.glob(search_path)
-            if matches:
-                return matches[0]
-        
-        # Find closest match
-        video_files = glob.glob(os.path.join(self.video_folder_path, f"user{user_id}-{date_str}*.mp4"))
-        video_files.extend(glob.glob(os.path.join(self.video_folder_path, f"user{user_id}-{date_str}*.mkv")))
+        try:
+            with os.scandir(self.video_folder_path) as it:
+                names = [e.name for e in it if e.is_file() and e.name.lower().endswith(_VIDEO_EXTENSIONS)]
+        except OSError as e:
+            print(f"Error scanning video folder {self.video_folder_path}: {e}")
+            return {}, {}
         
-        if video_files:
-            return video_files[0]
+        # Prefer .mp4 over .mkv for the same key
+        for name in sorted(names, key=lambda n: (not n.lower().endswith('.mp4'), n)):
+            match = _VIDEO_NAME_PATTERN.match(name)
+            if not match:
+                continue
+            
+            user_id, date_str, hour_str = match.groups()
+            video_path = os.path.join(self.video_folder_path, name)
+            by_date[(user_id, date_str)].append(video_path)
+            if hour_str is not None:
+                by_hour[(user_id, date_str, hour_str)].append(video_path)
         
-        return None
+        return dict(by_hour), dict(by_date)
+    
+    def lookup_video(self, user_id, date_str, hour_str):
+        """Look up a video in the index, falling back to any video from the same date"""
+        user_key = str(user_id)
+        matches = (self._video_index.get((user_key, date_str, hour_str))
+                   or self._video_index_by_date.get((user_key, date_str)))
+        return matches[0] if matches else None
+    
+    def find_video_file(self, user_id, timestamp):
+        """Find the corresponding video file for a user and timestamp"""
+        date_str = timestamp.strftime('%Y-%m-%d')
+        hour_str = timestamp.strftime('%H')
+        return self.lookup_video(user_id, date_str, hour_str)
     
     def extract_video_start_time(self, video_filename):
         """Extract start time from video filename"""
         try:
             basename = os.path.basename(video_filename)
             time_part = basename.split('-', 1)[1].rsplit('.', 1)[0]
-            video_start = datetime.strptime(time_part, '%Y-%m-%d %H-%M-%S')
+            match = _VIDEO_START_PATTERN.fullmatch(time_part)
+            if not match:
+                raise ValueError(f"time data '{time_part}' does not match format '%Y-%m-%d %H-%M-%S'")
+            video_start = datetime(*map(int, match.groups()))
             return video_start
         except Exception as e:
             print(f"Error parsing video filename {video_filename}: {e}")
@@ -125,19 +295,48 @@ class GPUVideoFrameExtractor:
     
     def generate_output_filename(self, user_id, timestamp, page):
         """Generate output filename for extracted frame"""
-        challenge = self.page_mapping.get(page, 'challenge_unknown')
-        time_str = timestamp.strftime('%H%M%S')
-        filename = f"user{user_id}_{challenge}_time{time_str}.jpg"
-        return filename
+        filename_fmt = self._filename_fmt.get(page, self._default_filename_fmt)
+        return filename_fmt(user_id, timestamp.hour, timestamp.minute, timestamp.second)
+    
+    def open_gpu_capture(self, video_path):
+        """Open video with NVDEC, falling back to FFmpeg with hardware acceleration"""
+        if hasattr(cv2, 'cudacodec'):
+            try:
+                return _NvdecCapture(video_path)
+            except cv2.error as e:
+                print(f"NVDEC decode not available ({e}), using FFmpeg hardware acceleration")
+        
+        # Hardware acceleration must be requested when the capture is opened
+        return cv2.VideoCapture(
+            video_path, cv2.CAP_FFMPEG,
+            [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY]
+        )
+    
+    def save_frame(self, frame, record, writer):
+        """Encode a frame as JPEG in memory and queue it on the writer"""
+        output_filename = self.generate_output_filename(
+            record['user_id'], record['timestamp'], record['page']
+        )
+        output_path = os.path.join(self.output_folder_path, output_filename)
+        
+        ok, buffer = cv2.imencode('.jpg', frame, self.jpeg_params)
+        if ok:
+            writer.submit(output_path, buffer)
+        else:
+            writer.add_result((False, f"Could not save frame to {output_path}"))
     
     def extract_frames_opencv_gpu(self, video_path, records, video_start_time):
-        """Extract frames using OpenCV with GPU acceleration"""
+        """
+        Extract frames using OpenCV with GPU acceleration
+        
+        Records must be sorted by timestamp and not precede video_start_time
+        (process_video_group prepares them this way).
+        """
+        writer = None
         try:
             # Open video with GPU decoder if available
             if self.use_gpu and self.gpu_available:
-                cap = cv2.VideoCapture(video_path, cv2.CAP_FFMPEG)
-                # Try to enable hardware acceleration
-                cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc('H', '2', '6', '4'))
+                cap = self.open_gpu_capture(video_path)
             else:
                 cap = cv2.VideoCapture(video_path)
             
@@ -150,49 +349,41 @@ class GPUVideoFrameExtractor:
             
             results = []
             
-            # Sort records by timestamp for efficient seeking
-            sorted_records = sorted(records, key=lambda x: x['timestamp'])
+            writer = _FrameWriter()
+            
+            # Records arrive sorted, so frames are decoded strictly forward
+            reader = _SequentialFrameReader(cap, seek_threshold=int(2 * fps))
             
-            for record in sorted_records:
+            for record in records:
                 timestamp = record['timestamp']
                 time_offset = (timestamp - video_start_time).total_seconds()
                 
-                if time_offset < 0:
-                    results.append((False, "Timestamp before video start"))
-                    continue
-                
                 # Calculate frame number
                 frame_number = int(time_offset * fps)
                 
-                # Seek to frame
-                cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
-                
-                ret, frame = cap.read()
+                ret, frame = reader.read(frame_number)
                 if not ret:
                     results.append((False, f"Could not read frame at {time_offset}s"))
                     continue
                 
-                # Generate output path
-                output_filename = self.generate_output_filename(
-                    record['user_id'], record['timestamp'], record['page']
-                )
-                output_path = os.path.join(self.output_folder_path, output_filename)
-                
-                # Save frame
-                if cv2.imwrite(output_path, frame, [cv2.IMWRITE_JPEG_QUALITY, 95]):
-                    results.append((True, output_path))
-                    print(f"✓ Extracted: {os.path.basename(output_path)}")
-                else:
-                    results.append((False, f"Could not save frame to {output_path}"))
+                self.save_frame(frame, record, writer)
             
             cap.release()
-            return results
+            return results + writer.close()
             
         except Exception as e:
+            if writer is not None:
+                writer.close()
             return [(False, str(e)) for _ in records]
     
     def extract_frames_memory_efficient(self, video_path, records, video_start_time):
-        """Memory-efficient frame extraction using frame skipping"""
+        """
+        Memory-efficient frame extraction using frame skipping
+        
+        Records must be sorted by timestamp and not precede video_start_time
+        (process_video_group prepares them this way).
+        """
+        writer = None
         try:
             cap = cv2.VideoCapture(video_path)
             if not cap.isOpened():
@@ -205,63 +396,32 @@ class GPUVideoFrameExtractor:
                 fps = 30
             
             results = []
+            writer = _FrameWriter()
+            
+            # Pick the nearest frame for each record directly instead of buffering a
+            # second of frames; only the current target frame is kept in memory
+            reader = _SequentialFrameReader(cap, seek_threshold=int(2 * fps))
             
-            # Group records by second to minimize seeking
-            time_groups = defaultdict(list)
             for record in records:
                 time_offset = (record['timestamp'] - video_start_time).total_seconds()
-                if time_offset >= 0:
-                    second = int(time_offset)
-                    time_groups[second].append((time_offset, record))
-            
-            # Process each second group
-            for second in sorted(time_groups.keys()):
-                if second * fps >= total_frames:
-                    for _, record in time_groups[second]:
-                        results.append((False, "Frame beyond video duration"))
+                if time_offset * fps >= total_frames:
+                    results.append((False, "Frame beyond video duration"))
                     continue
                 
-                # Seek to the second
-                cap.set(cv2.CAP_PROP_POS_FRAMES, int(second * fps))
+                target_frame = min(int(round(time_offset * fps)), total_frames - 1)
+                ret, frame = reader.read(target_frame)
                 
-                # Read a few frames around this second
-                frames_buffer = []
-                for i in range(int(fps) + 1):  # Read 1 second worth of frames
-                    ret, frame = cap.read()
-                    if ret:
-                        frames_buffer.append((second + i/fps, frame))
-                    else:
-                        break
-                
-                # Extract the closest frame for each record in this second
-                for time_offset, record in time_groups[second]:
-                    closest_frame = None
-                    min_diff = float('inf')
-                    
-                    for frame_time, frame in frames_buffer:
-                        diff = abs(frame_time - time_offset)
-                        if diff < min_diff:
-                            min_diff = diff
-                            closest_frame = frame
-                    
-                    if closest_frame is not None:
-                        output_filename = self.generate_output_filename(
-                            record['user_id'], record['timestamp'], record['page']
-                        )
-                        output_path = os.path.join(self.output_folder_path, output_filename)
-                        
-                        if cv2.imwrite(output_path, closest_frame, [cv2.IMWRITE_JPEG_QUALITY, 95]):
-                            results.append((True, output_path))
-                            print(f"✓ Extracted: {os.path.basename(output_path)}")
-                        else:
-                            results.append((False, f"Could not save frame"))
-                    else:
-                        results.append((False, f"No frame found for timestamp"))
+                if ret:
+                    self.save_frame(frame, record, writer)
+                else:
+                    results.append((False, f"No frame found for timestamp"))
             
             cap.release()
-            return results
+            return results + writer.close()
             
         except Exception as e:
+            if writer is not None:
+                writer.close()
             return [(False, str(e)) for _ in records]
     
     def process_video_group(self, args):
@@ -272,15 +432,24 @@ class GPUVideoFrameExtractor:
         if not video_start_time:
             return [(False, "Could not parse video start time") for _ in records]
         
+        # Sort and filter here only; the extraction methods rely on this ordering,
+        # and a video without usable records is never opened
+        records = sorted(records, key=lambda x: x['timestamp'])
+        results = [(False, "Timestamp before video start")
+                   for record in records if record['timestamp'] < video_start_time]
+        records = [record for record in records if record['timestamp'] >= video_start_time]
+        if not records:
+            return results
+        
         print(f"Processing {len(records)} frames from {os.path.basename(video_path)}")
         
         # Choose extraction method based on number of records
         if len(records) > 10:
             # Use memory-efficient method for many frames
-            return self.extract_frames_memory_efficient(video_path, records, video_start_time)
+            return results + self.extract_frames_memory_efficient(video_path, records, video_start_time)
         else:
             # Use GPU method for few frames
-            return self.extract_frames_opencv_gpu(video_path, records, video_start_time)
+            return results + self.extract_frames_opencv_gpu(video_path, records, video_start_time)
     
     def process_all_records(self):
         """Process all records using the fastest available method"""
@@ -298,12 +467,29 @@ class GPUVideoFrameExtractor:
         successful_extractions = 0
         failed_extractions = 0
         
-        # Use ThreadPoolExecutor for I/O bound operations
-        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(video_groups))) as executor:
+        workers = min(self.max_workers, len(video_groups))
+        if self.use_gpu and self.gpu_available:
+            # NVDEC path: threads share a single CUDA context
+            executor = ThreadPoolExecutor(max_workers=workers)
+            process_group = self.process_video_group
+        else:
+            # Software decode and JPEG encoding are CPU-bound, so use processes to avoid the GIL
+            executor = ProcessPoolExecutor(
+                max_workers=workers, initializer=_init_worker, initargs=(self,)
+            )
+            process_group = _process_video_group
+        
+        with executor:
             # Process video groups in parallel
-            args_list = list(video_groups.items())
+            # Groups are keyed by video path, so each file is opened by exactly one worker.
+            # Dispatch the largest groups first to avoid a long tail at the end
+            args_list = sorted(
+                ((video_path, self.build_records(df, positions))
+                 for video_path, positions in video_groups.items()),
+                key=lambda item: len(item[1]), reverse=True
+            )
             
-            all_results = executor.map(self.process_video_group, args_list)
+            all_results = executor.map(process_group, args_list)
             
             # Collect results
             for results in all_results:
@@ -321,17 +507,55 @@ class GPUVideoFrameExtractor:
         print(f"Failed extractions: {failed_extractions}")
         print(f"Output folder: {self.output_folder_path}")
 
+# Extractor used by worker processes, sent once per process by the pool initializer
+_worker_extractor = None
+
+def _init_worker(extractor):
+    """Store the extractor in a worker process"""
+    global _worker_extractor
+    _worker_extractor = extractor
+
+def _process_video_group(args):
+    """Module-level (picklable) entry point for ProcessPoolExecutor"""
+    return _worker_extractor.process_video_group(args)
+
+def _total_memory_bytes():
+    """Total physical memory; reads /proc/meminfo on Linux to avoid a psutil import"""
+    try:
+        with open('/proc/meminfo') as f:
+            for line in f:
+                if line.startswith('MemTotal:'):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError):
+        pass
+    
+    try:
+        import psutil
+    except ImportError:
+        return None
+    return psutil.virtual_memory().total
+
 def check_system_capabilities():
     """Check system capabilities for optimal performance"""
     print("=== SYSTEM CAPABILITIES ===")
     
     # Check CPU cores
-    cpu_cores = mp.cpu_count()
+    cpu_cores = _CPU_COUNT
     print(f"CPU cores: {cpu_cores}")
     
     # Check OpenCV build info
     print(f"OpenCV version: {cv2.__version__}")
     
+    # JPEG encoding is fastest with libjpeg-turbo (SIMD DCT)
+    jpeg_backend = next(
+        (line.split(':', 1)[1].strip() for line in cv2.getBuildInformation().splitlines()
+         if line.strip().startswith('JPEG:')),
+        'unknown'
+    )
+    print(f"JPEG codec: {jpeg_backend}")
+    if 'turbo' not in jpeg_backend:
+        print("⚠️  OpenCV is not linked against libjpeg-turbo, JPEG encoding will be slower")
+    
     # Check CUDA support
     try:
         if hasattr(cv2, 'cuda'):
@@ -343,8 +567,12 @@ def check_system_capabilities():
         print("CUDA: Not available")
     
     # Memory recommendation
-    import psutil
-    memory_gb = psutil.virtual_memory().total / (1024**3)
+    memory_bytes = _total_memory_bytes()
+    if memory_bytes is None:
+        print("Available RAM: unknown (install psutil for memory detection)")
+        return
+    
+    memory_gb = memory_bytes / (1024**3)
     print(f"Available RAM: {memory_gb:.1f} GB")
     
     if memory_gb < 8:
@@ -374,7 +602,7 @@ def main():
     if use_gpu:
         max_workers = 2  # GPU processing is memory intensive
     else:
-        max_workers = min(mp.cpu_count(), 6)  # CPU processing can use more workers
+        max_workers = min(_CPU_COUNT, 6)  # CPU processing can use more workers
     
     print(f"Using {max_workers} workers")
     